@@ -1,80 +1,125 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
+import re
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor
 
 st.set_page_config(page_title="Website Last Updated Checker", layout="centered")
 
 st.title("🔍 Website Last Updated Checker")
 st.markdown("Paste any URL below to analyze when it was last updated using 4 methods.")
 
-url = st.text_input("📥 Enter a company page URL", placeholder="https://example.com/page")
+# Shared session so HEAD/GET to the same host reuse keep-alive connections across reruns
+@st.cache_resource
+def get_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-if url:
-    with st.spinner("Checking..."):
+_SESSION = get_session()
 
-        # Method 1: HTTP Header
-        def get_last_modified_header(url):
-            try:
-                response = requests.head(url, allow_redirects=True, timeout=10)
-                return response.headers.get("Last-Modified", None)
-            except:
-                return None
+# Method 2 splits the raw HTML on tags and keeps text segments that mention an update keyword.
+# "<[^<>]*>" stops at the next "<" or ">", so splitting stays linear in the page size.
+# Differences from a BeautifulSoup text-node scan:
+# - keywords inside HTML comments are not reported
+# - a "<...>" run inside script/style text (e.g. "a<b && c>d") is taken as a tag and splits that text
+# - a "<" or ">" inside an attribute value or comment can leak part of that tag into the text
+TAG_RE = re.compile(r"<[^<>]*>")
+UPDATE_KEYWORD_RE = re.compile(r"last updated|updated on|published|modified|posted on", re.IGNORECASE)
 
-        # Method 2: HTML Text Scraping
-        def find_possible_timestamp_text(url):
-            matches = []
-            try:
-                response = requests.get(url, timeout=10)
-                soup = BeautifulSoup(response.text, "html.parser")
-                texts = soup.find_all(text=True)
-                for text in texts:
-                    if any(kw in text.lower() for kw in ["last updated", "updated on", "published", "modified", "posted on"]):
-                        cleaned = text.strip().replace("\n", " ")
-                        if len(cleaned) < 120:
-                            matches.append(cleaned)
-                return matches
-            except:
-                return []
+# Cached fetchers raise on network and HTTP errors so st.cache_data never stores a failed lookup
+# Method 1: HTTP Header
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=10)
+def get_last_modified_header(url):
+    response = _SESSION.head(url, allow_redirects=True, timeout=10)
+    response.raise_for_status()
+    return response.headers.get("Last-Modified", None)
 
-        # Method 3: JSON-LD Structured Metadata
-        def extract_json_ld_dates(url):
-            dates = {}
-            try:
-                response = requests.get(url, timeout=10)
-                soup = BeautifulSoup(response.text, "html.parser")
-                scripts = soup.find_all("script", type="application/ld+json")
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict):
-                            for key in ["datePublished", "dateModified", "uploadDate"]:
-                                if key in data:
-                                    dates[key] = data[key]
-                    except:
-                        continue
-            except:
-                pass
-            return dates
+# Page HTML shared by Methods 2 and 3
+def fetch_page_html(url):
+    response = _SESSION.get(url, timeout=10)
+    response.raise_for_status()
+    return response.text
+
+# Method 2: HTML Text Scraping
+def find_possible_timestamp_text(html):
+    matches = []
+    try:
+        for text in TAG_RE.split(html):
+            if UPDATE_KEYWORD_RE.search(text):
+                cleaned = unescape(text).strip().replace("\n", " ")
+                if len(cleaned) < 120:
+                    matches.append(cleaned)
+        return matches
+    except:
+        return []
+
+# Method 3: JSON-LD Structured Metadata
+JSON_LD_STRAINER = SoupStrainer("script", type="application/ld+json")
 
-        # Method 4: Wayback Machine API
-        def get_wayback_snapshots(url):
+def extract_json_ld_dates(soup):
+    dates = {}
+    try:
+        scripts = soup.find_all("script", type="application/ld+json")
+        for script in scripts:
             try:
-                api_url = f"https://archive.org/wayback/available?url={url}"
-                response = requests.get(api_url, timeout=10).json()
-                snapshot = response.get("archived_snapshots", {}).get("closest", {})
-                if snapshot:
-                    return snapshot["timestamp"], snapshot["url"]
-                else:
-                    return None, None
+                data = json.loads(script.string)
+                if isinstance(data, dict):
+                    for key in ["datePublished", "dateModified", "uploadDate"]:
+                        if key in data:
+                            dates[key] = data[key]
             except:
-                return None, None
+                continue
+    except:
+        pass
+    return dates
+
+# Methods 2 and 3: one fetch, one strained parse, cached with the results
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=10)
+def check_page_html(url):
+    html = fetch_page_html(url)
+    soup = BeautifulSoup(html, "lxml", parse_only=JSON_LD_STRAINER)
+    return find_possible_timestamp_text(html), extract_json_ld_dates(soup)
+
+# Method 4: Wayback Machine API
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=10)
+def get_wayback_snapshots(url):
+    api_url = f"https://archive.org/wayback/available?url={url}"
+    response = _SESSION.get(api_url, timeout=10)
+    response.raise_for_status()
+    snapshot = response.json().get("archived_snapshots", {}).get("closest", {})
+    if snapshot:
+        return snapshot["timestamp"], snapshot["url"]
+    else:
+        return None, None
+
+# Result of a lookup future, or the fallback if the lookup failed
+def result_or_default(future, default):
+    try:
+        return future.result()
+    except:
+        return default
+
+
+url = st.text_input("📥 Enter a company page URL", placeholder="https://example.com/page")
+
+if url:
+    with st.spinner("Checking..."):
+        # Run the network lookups concurrently; Methods 2 and 3 share one fetch
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            header_future = executor.submit(get_last_modified_header, url)
+            page_future = executor.submit(check_page_html, url)
+            wayback_future = executor.submit(get_wayback_snapshots, url)
 
-        # Run all 4 methods
-        header = get_last_modified_header(url)
-        html_texts = find_possible_timestamp_text(url)
-        jsonld = extract_json_ld_dates(url)
-        wayback_date, wayback_url = get_wayback_snapshots(url)
+        header = result_or_default(header_future, None)
+        html_texts, jsonld = result_or_default(page_future, ([], {}))
+        wayback_date, wayback_url = result_or_default(wayback_future, (None, None))
 
     # Display results
     st.subheader("🛠 Results:")